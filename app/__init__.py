@@ -1,13 +1,44 @@
 import os
+import threading
 
 from dotenv import load_dotenv
 from flask import Flask
 
-from app.constants import FLASK_SECRET_KEY, SECRET_KEY
+from app.constants import (
+    DEVELOPMENT,
+    FLASK_ENV,
+    FLASK_SECRET_KEY,
+    LOCAL,
+    PRODUCTION,
+    SECRET_KEY,
+)
 from app.utils.secret_manager import get_secret
 
 from .config import get_config
 
+# Deployed environments never ship a .env file; anything else (including
+# unrecognised values, which get_config maps to LocalConfig) loads it
+_NO_DOTENV_ENVIRONMENTS = frozenset({DEVELOPMENT, PRODUCTION})
+
+_dotenv_lock = threading.Lock()
+_dotenv_loaded = False
+
+
+def _load_dotenv_once() -> None:
+    """
+    Load the .env file at most once per process.
+    Skipped for deployed environments, which never ship a .env file.
+    """
+    global _dotenv_loaded
+
+    if os.environ.get(FLASK_ENV, LOCAL).lower() in _NO_DOTENV_ENVIRONMENTS:
+        return
+
+    with _dotenv_lock:
+        if not _dotenv_loaded:
+            load_dotenv(override=False)
+            _dotenv_loaded = True
+
 
 def create_app() -> Flask:
     """
@@ -20,7 +51,7 @@ def create_app() -> Flask:
     - testing: TestingConfig (unit tests)
     """
 
-    load_dotenv(override=False)
+    _load_dotenv_once()
 
     app = Flask(__name__)
 
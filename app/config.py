@@ -1,7 +1,7 @@
 """Configuration classes for different environments."""
 
+import functools
 import os
-from typing import Optional
 
 from app.constants import (
     DEVELOPMENT,
@@ -17,11 +17,16 @@ class Config:
     """Base configuration class with common settings."""
 
     # Flask settings
-    SECRET_KEY: Optional[str] = os.environ.get(
+    SECRET_KEY: str | None = os.environ.get(
         SECRET_KEY, "dev-secret-key-change-in-production"
     )
     TESTING = False
     DEBUG = False
+    # Guard for views that read the request body: Werkzeug responds 413 when
+    # form/data/get_data() exceed this. Views that never read the body are
+    # unaffected. It applies app-wide, so any future upload route will be
+    # rejected with 413 unless this limit is raised.
+    MAX_CONTENT_LENGTH = 64 * 1024
 
     # App settings
     ENVIRONMENT = os.environ.get(FLASK_ENV, LOCAL)
@@ -70,11 +75,18 @@ config = {
 }
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> type[Config]:
     """
     Get the appropriate configuration class based on FLASK_ENV.
 
     Defaults to LocalConfig if FLASK_ENV is not set or invalid.
+    The result is cached for the life of the process.
     """
     env = os.environ.get(FLASK_ENV, LOCAL).lower()
     return config.get(env, LocalConfig)
+
+
+def _invalidate_config_cache() -> None:
+    """Clear the cached configuration class, e.g. after changing FLASK_ENV."""
+    get_config.cache_clear()
@@ -1,18 +1,57 @@
 import os
+import threading
+import time
 
 from google.cloud import secretmanager
 
 from app.constants import PROJECT_ID
 
+# Single attempt with this deadline (the client's default retry policy is
+# disabled) so a degraded Secret Manager fails worker boot within seconds
+SECRET_REQUEST_TIMEOUT = 5.0
+# How long a fetched secret value is reused before it is read again
+SECRET_CACHE_TTL = 300.0
+
+_client: secretmanager.SecretManagerServiceClient | None = None
+_client_lock = threading.Lock()
+_secret_cache: dict[str, tuple[float, str]] = {}
+
+
+def _get_client() -> secretmanager.SecretManagerServiceClient:
+    """
+    Return the process-wide Secret Manager client.
+    Created on first use so the gRPC channel is only opened once.
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = secretmanager.SecretManagerServiceClient()
+    return _client
+
 
 def get_secret(secret: str) -> str:
     """
     Fetch the latest version of a secret from Secret Manager
     secret_name: str = name of the secret to fetch
+    Values are cached per process for SECRET_CACHE_TTL seconds, keyed by
+    the full resource path so a PROJECT_ID change misses the cache.
     Returns:
         str: The secret value
     """
     secret_name = f"projects/{os.environ.get(PROJECT_ID)}/secrets/{secret}/versions/latest"
-    client = secretmanager.SecretManagerServiceClient()
-    response = client.access_secret_version(request={"name": secret_name})
-    return response.payload.data.decode("UTF-8")
+    now = time.monotonic()
+    cached = _secret_cache.get(secret_name)
+    if cached and now - cached[0] < SECRET_CACHE_TTL:
+        return cached[1]
+
+    client = _get_client()
+    response = client.access_secret_version(
+        request={"name": secret_name},
+        retry=None,
+        timeout=SECRET_REQUEST_TIMEOUT,
+    )
+    value = response.payload.data.decode("UTF-8")
+    _secret_cache[secret_name] = (now, value)
+    return value
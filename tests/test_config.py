@@ -0,0 +1,52 @@
+import pytest
+from flask import Flask, request
+
+from app.config import (
+    Config,
+    DevelopmentConfig,
+    LocalConfig,
+    ProductionConfig,
+    _invalidate_config_cache,
+    get_config,
+)
+from app.constants import FLASK_ENV
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Reset the cached config class around each test."""
+    _invalidate_config_cache()
+    yield
+    _invalidate_config_cache()
+
+
+def test_get_config_is_cached(monkeypatch):
+    monkeypatch.setenv(FLASK_ENV, "production")
+    assert get_config() is ProductionConfig
+
+    monkeypatch.setenv(FLASK_ENV, "development")
+    assert get_config() is ProductionConfig
+
+    _invalidate_config_cache()
+    assert get_config() is DevelopmentConfig
+
+
+def test_get_config_defaults_to_local(monkeypatch):
+    monkeypatch.setenv(FLASK_ENV, "unknown")
+
+    assert get_config() is LocalConfig
+
+
+def test_max_content_length_rejects_large_bodies():
+    app = Flask(__name__)
+    app.config.from_object(Config)
+
+    @app.route("/echo", methods=["POST"])
+    def echo():
+        return str(len(request.get_data()))
+
+    client = app.test_client()
+    limit = Config.MAX_CONTENT_LENGTH
+
+    assert client.post("/echo", data=b"x" * limit).status_code == 200
+    assert client.post("/echo", data=b"x" * (limit + 1)).status_code == 413
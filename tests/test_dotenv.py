@@ -0,0 +1,42 @@
+import pytest
+
+import app as app_module
+from app.constants import FLASK_ENV
+
+
+@pytest.fixture
+def load_dotenv_calls(monkeypatch):
+    """Count calls to load_dotenv with a fresh once-per-process flag."""
+    calls = []
+    monkeypatch.setattr(
+        app_module, "load_dotenv", lambda **kwargs: calls.append(kwargs)
+    )
+    monkeypatch.setattr(app_module, "_dotenv_loaded", False)
+    return calls
+
+
+def test_dotenv_skipped_in_production(monkeypatch, load_dotenv_calls):
+    monkeypatch.setenv(FLASK_ENV, "production")
+
+    app_module._load_dotenv_once()
+
+    assert load_dotenv_calls == []
+
+
+def test_dotenv_loaded_once_locally(monkeypatch, load_dotenv_calls):
+    monkeypatch.setenv(FLASK_ENV, "local")
+
+    app_module._load_dotenv_once()
+    app_module._load_dotenv_once()
+
+    assert len(load_dotenv_calls) == 1
+
+
+def test_dotenv_loaded_for_unknown_environment(
+    monkeypatch, load_dotenv_calls
+):
+    monkeypatch.setenv(FLASK_ENV, "locall")
+
+    app_module._load_dotenv_once()
+
+    assert len(load_dotenv_calls) == 1
@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+import pytest
+from google.api_core import exceptions
+
+from app.constants import PROJECT_ID
+from app.utils import secret_manager
+
+
+class FakeClient:
+    """Stand-in for SecretManagerServiceClient that counts RPCs."""
+
+    def __init__(self):
+        self.calls = 0
+        self.error = None
+        self.kwargs = {}
+
+    def access_secret_version(self, request, **kwargs):
+        self.calls += 1
+        self.kwargs = kwargs
+        if self.error:
+            raise self.error
+        data = f"value-{self.calls}".encode("UTF-8")
+        return SimpleNamespace(payload=SimpleNamespace(data=data))
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(secret_manager, "_client", client)
+    monkeypatch.setattr(secret_manager, "_secret_cache", {})
+    return client
+
+
+def test_get_secret_is_cached(fake_client):
+    assert secret_manager.get_secret("flask-secret-key") == "value-1"
+    assert secret_manager.get_secret("flask-secret-key") == "value-1"
+    assert fake_client.calls == 1
+    assert fake_client.kwargs == {
+        "retry": None,
+        "timeout": secret_manager.SECRET_REQUEST_TIMEOUT,
+    }
+
+
+def test_get_secret_refreshes_after_ttl(fake_client, monkeypatch):
+    monkeypatch.setattr(secret_manager, "SECRET_CACHE_TTL", 0.0)
+
+    assert secret_manager.get_secret("flask-secret-key") == "value-1"
+    assert secret_manager.get_secret("flask-secret-key") == "value-2"
+    assert fake_client.calls == 2
+
+
+def test_get_secret_cache_is_per_project(fake_client, monkeypatch):
+    monkeypatch.setenv(PROJECT_ID, "cloned-it-dev")
+    assert secret_manager.get_secret("flask-secret-key") == "value-1"
+
+    monkeypatch.setenv(PROJECT_ID, "cloned-it-prod")
+    assert secret_manager.get_secret("flask-secret-key") == "value-2"
+    assert fake_client.calls == 2
+
+
+def test_get_secret_fails_fast_when_unavailable(fake_client):
+    fake_client.error = exceptions.ServiceUnavailable("Secret Manager down")
+
+    with pytest.raises(exceptions.ServiceUnavailable):
+        secret_manager.get_secret("flask-secret-key")
+    assert fake_client.calls == 1
+    assert fake_client.kwargs["retry"] is None